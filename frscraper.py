@@ -1,29 +1,178 @@
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import yaml
 from io import BytesIO
 from minio import Minio
 import os
 import argparse
+import logging
+import sys
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
-def log_with_timestamp(message, level="INFO"):
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-    print(f"[{timestamp}] {level}: {message}")
+AGENCIES_API_URL = 'https://www.federalregister.gov/api/v1/agencies'
+REQUEST_TIMEOUT = 60
+MAX_DOWNLOAD_WORKERS = 16
+MAX_PENDING_DOWNLOADS = 2 * MAX_DOWNLOAD_WORKERS
+PDF_UPLOAD_PART_SIZE = 10 * 1024 * 1024
+CACHED_LISTING_PAGES = 3
+ABSTRACTS_FLUSH_INTERVAL = 500
+AGENCIES_CACHE_TTL = 24 * 60 * 60
+
+# Characters that are unsafe in object names, mapped to '_' in one pass
+SAFE_FILENAME_TABLE = str.maketrans(
+    {c: "_" for c in '/\\:*?"<>|' + ''.join(chr(i) for i in range(32))}
+)
+
+logger = logging.getLogger("frscraper")
+
+def configure_logging():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(asctime)s.%(msecs)03d] %(levelname)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        stream=sys.stdout
+    )
 
 def parse_args():
     parser = argparse.ArgumentParser(description='Scrape Federal Register documents')
     parser.add_argument('--all', action='store_true', 
                        help='Scrape all documents, even if some already exist')
+    parser.add_argument('--refresh-agencies', action='store_true',
+                       help='Refetch the agency list even if the cached copy is still fresh')
     return parser.parse_args()
 
+def create_session():
+    """
+    Builds a requests session with a pooled, retrying HTTPS adapter so
+    connections to the Federal Register and GPO hosts are reused.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+    )
+    session.mount("https://", adapter)
+    # JSON responses compress well; PDF downloads override this with identity
+    session.headers.update({
+        "User-Agent": "fedreg-scraper/1.0",
+        "Accept-Encoding": "gzip, deflate"
+    })
+    return session
+
+def fetch_json(session, url, http_cache=None):
+    """
+    Fetches and decodes a JSON document.
+    When an http_cache dict is given, the stored ETag / Last-Modified for the
+    URL are sent as validators and a 304 response is served from the cache;
+    fresh 200 responses carrying validators are stored back into it.
+    Returns a (data, cache_updated) tuple, where data is None if the server
+    responds with anything other than 200 or 304 and cache_updated tells
+    whether http_cache was modified.
+    """
+    headers = {}
+    cached = http_cache.get(url) if http_cache is not None else None
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 304 and cached:
+        logger.info("Not modified, using cached response for %s", url)
+        return cached['data'], False
+    if response.status_code != 200:
+        logger.error("Error fetching %s: %s", url, response.status_code)
+        return None, False
+
+    data = orjson.loads(response.content)
+    if http_cache is not None:
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            http_cache[url] = {'etag': etag, 'last_modified': last_modified, 'data': data}
+            return data, True
+        if http_cache.pop(url, None) is not None:
+            # The old validators no longer describe the body we just received
+            return data, True
+    return data, False
+
+def fetch_pdf(session, url):
+    """
+    Opens a streaming download of a PDF. The caller is responsible for
+    closing the returned response once the body has been consumed.
+    Returns None if the server responds with anything other than 200.
+    """
+    # Ask for the raw bytes so Content-Length matches what response.raw yields
+    response = session.get(url, stream=True, headers={"Accept-Encoding": "identity"}, timeout=REQUEST_TIMEOUT)
+    if response.status_code != 200:
+        logger.error("Error downloading %s: %s", url, response.status_code)
+        response.close()
+        return None
+    return response
+
+def download_and_upload_pdf(session, client, bucket_name, pdf_url, pdf_filename, pdf_object_path):
+    """
+    Streams a single PDF from the Federal Register straight into MinIO
+    without buffering the whole file in memory.
+    Returns True on success, False if the PDF could not be downloaded.
+    Safe to run from worker threads.
+    """
+    doc_start_time = time.time()
+    logger.info("Streaming %s to MinIO", pdf_filename)
+
+    pdf_response = fetch_pdf(session, pdf_url)
+    if pdf_response is None:
+        return False
+
+    with pdf_response:
+        # Without a Content-Length, fall back to a multipart upload of unknown size
+        content_length = pdf_response.headers.get("Content-Length")
+        length = int(content_length) if content_length is not None else -1
+        client.put_object(
+            bucket_name,
+            pdf_object_path,
+            pdf_response.raw,
+            length=length,
+            part_size=PDF_UPLOAD_PART_SIZE if length == -1 else 0,
+            content_type='application/pdf'
+        )
+
+    doc_time = time.time() - doc_start_time
+    logger.info("Processed %s in %.2fs", pdf_filename, doc_time)
+    return True
+
+def build_agency_index(agencies):
+    """
+    Maps lowercased agency short names and full names to their agency
+    records. Short names take precedence over full names on collisions,
+    and the first agency listed wins among equal keys.
+    """
+    index = {}
+    for a in agencies:
+        short_name_or_name = a['short_name'] if a['short_name'] else a['name']
+        index.setdefault(short_name_or_name.lower(), a)
+    for a in agencies:
+        if a.get('name'):
+            index.setdefault(a['name'].lower(), a)
+    return index
+
 def load_config(config_path="config.yaml"):
-    log_with_timestamp(f"Loading config from {config_path}")
+    logger.info("Loading config from %s", config_path)
     start_time = time.time()
     with open(config_path, 'r') as f:
         config = yaml.safe_load(f)
-    log_with_timestamp(f"Config loaded in {(time.time() - start_time):.2f} seconds")
+    logger.info("Config loaded in %.2f seconds", time.time() - start_time)
     return config
 
 def load_existing_abstracts(client, bucket_name, abstracts_path):
@@ -32,15 +181,14 @@ def load_existing_abstracts(client, bucket_name, abstracts_path):
     If the file does not exist, returns an empty dictionary.
     """
     start_time = time.time()
-    log_with_timestamp(f"Attempting to load existing abstracts from {bucket_name}/{abstracts_path}")
+    logger.info("Attempting to load existing abstracts from %s/%s", bucket_name, abstracts_path)
     try:
         data = client.get_object(bucket_name, abstracts_path)
-        existing_data = data.read().decode('utf-8')
-        result = json.loads(existing_data)
-        log_with_timestamp(f"Loaded {len(result)} existing abstracts in {(time.time() - start_time):.2f} seconds")
+        result = orjson.loads(data.read())
+        logger.info("Loaded %s existing abstracts in %.2f seconds", len(result), time.time() - start_time)
         return result
     except Exception as e:
-        log_with_timestamp(f"No existing abstracts found: {str(e)}", "WARNING")
+        logger.warning("No existing abstracts found: %s", e)
         return {}
 
 def save_abstracts_to_minio(client, bucket_name, abstracts_path, abstracts_dict):
@@ -48,25 +196,95 @@ def save_abstracts_to_minio(client, bucket_name, abstracts_path, abstracts_dict)
     Uploads the updated abstracts JSON to MinIO, appending new data.
     """
     start_time = time.time()
-    log_with_timestamp(f"Saving {len(abstracts_dict)} abstracts to MinIO")
-    abstracts_json = json.dumps(abstracts_dict, indent=4)
-    abstracts_data = BytesIO(abstracts_json.encode())
+    logger.info("Saving %s abstracts to MinIO", len(abstracts_dict))
+    abstracts_json = orjson.dumps(abstracts_dict, option=orjson.OPT_INDENT_2)
     client.put_object(
         bucket_name,
         abstracts_path,
-        abstracts_data,
+        BytesIO(abstracts_json),
         length=len(abstracts_json),
         content_type='application/json'
     )
-    log_with_timestamp(f"Abstracts saved in {(time.time() - start_time):.2f} seconds")
+    logger.info("Abstracts saved in %.2f seconds", time.time() - start_time)
 
-def main():
+def load_http_cache(client, bucket_name, http_cache_path):
+    """
+    Attempts to load the cached API responses and their validators from MinIO.
+    If the file does not exist or is not a dict of dicts, returns an empty dictionary.
+    """
+    try:
+        data = client.get_object(bucket_name, http_cache_path)
+        result = orjson.loads(data.read())
+    except Exception as e:
+        logger.warning("No cached API responses found: %s", e)
+        return {}
+
+    if not isinstance(result, dict) or not all(isinstance(entry, dict) for entry in result.values()):
+        logger.warning("Cached API responses at %s are malformed, ignoring them", http_cache_path)
+        return {}
+    logger.info("Loaded %s cached API responses", len(result))
+    return result
+
+def save_http_cache(client, bucket_name, http_cache_path, http_cache):
+    """
+    Uploads the cached API responses and their validators to MinIO.
+    """
+    http_cache_data = orjson.dumps(http_cache)
+    client.put_object(
+        bucket_name,
+        http_cache_path,
+        BytesIO(http_cache_data),
+        length=len(http_cache_data),
+        content_type='application/json'
+    )
+    logger.info("Saved %s cached API responses", len(http_cache))
+
+def load_cached_agencies(client, bucket_name, agencies_cache_path):
+    """
+    Attempts to load the cached agency list and its validators from MinIO.
+    Returns None if the cache does not exist or is malformed.
+    """
+    try:
+        data = client.get_object(bucket_name, agencies_cache_path)
+        cached = orjson.loads(data.read())
+    except Exception as e:
+        logger.warning("No cached agency list found: %s", e)
+        return None
+
+    if (not isinstance(cached, dict)
+            or not isinstance(cached.get('agencies'), list)
+            or not isinstance(cached.get('fetched_at'), (int, float))):
+        logger.warning("Cached agency list at %s is malformed, refreshing", agencies_cache_path)
+        return None
+    return cached
+
+def save_cached_agencies(client, bucket_name, agencies_cache_path, agencies, etag=None, last_modified=None):
+    """
+    Uploads the agency list to MinIO along with the time it was fetched
+    and the validators needed to revalidate it once it goes stale.
+    """
+    agencies_data = orjson.dumps({
+        'fetched_at': time.time(),
+        'etag': etag,
+        'last_modified': last_modified,
+        'agencies': agencies
+    })
+    client.put_object(
+        bucket_name,
+        agencies_cache_path,
+        BytesIO(agencies_data),
+        length=len(agencies_data),
+        content_type='application/json'
+    )
+    logger.info("Cached %s agencies to %s", len(agencies), agencies_cache_path)
+
+def scrape(session, executor):
     script_start_time = time.time()
-    log_with_timestamp("Starting Federal Register document scraper")
+    logger.info("Starting Federal Register document scraper")
     
     # Parse command line arguments
     args = parse_args()
-    log_with_timestamp(f"Running with --all={args.all}")
+    logger.info("Running with --all=%s --refresh-agencies=%s", args.all, args.refresh_agencies)
     
     # Load config
     config = load_config("config.yaml")
@@ -84,10 +302,10 @@ def main():
     parent_folder = config["parent_folder"]
     agencies_to_scrape = config["agencies"]
     
-    log_with_timestamp(f"Will process {len(agencies_to_scrape)} agencies: {', '.join(agencies_to_scrape)}")
+    logger.info("Will process %s agencies: %s", len(agencies_to_scrape), ', '.join(agencies_to_scrape))
 
     # Set up MinIO client
-    log_with_timestamp(f"Connecting to MinIO at {endpoint}")
+    logger.info("Connecting to MinIO at %s", endpoint)
     client = Minio(
         endpoint,
         access_key=access_key,
@@ -100,16 +318,63 @@ def main():
     abstracts_path = f"{parent_folder}/abstracts.json"
     existing_abstracts = load_existing_abstracts(client, bucket_name, abstracts_path)
 
-    # Fetch full list of agencies from Federal Register
-    log_with_timestamp("Fetching agency list from Federal Register API")
-    api_start_time = time.time()
-    agency_api_url = 'https://www.federalregister.gov/api/v1/agencies'
-    response = requests.get(agency_api_url)
-    all_fr_agencies = response.json()
-    log_with_timestamp(f"Retrieved {len(all_fr_agencies)} agencies in {(time.time() - api_start_time):.2f} seconds")
+    # Load cached API responses used for conditional requests
+    http_cache_path = f"{parent_folder}/_http_cache.json"
+    http_cache = load_http_cache(client, bucket_name, http_cache_path)
+    http_cache_dirty = False
+
+    # Reuse the cached agency list unless it is stale or a refresh was requested
+    agencies_cache_path = f"{parent_folder}/_agencies.json"
+    all_fr_agencies = None
+    cached_agencies = None
+    if not args.refresh_agencies:
+        cached_agencies = load_cached_agencies(client, bucket_name, agencies_cache_path)
+    if cached_agencies is not None:
+        age = time.time() - cached_agencies['fetched_at']
+        if age < AGENCIES_CACHE_TTL:
+            logger.info("Using %s cached agencies fetched %.0f seconds ago", len(cached_agencies['agencies']), age)
+            all_fr_agencies = cached_agencies['agencies']
+        else:
+            logger.info("Cached agency list is %.0f seconds old, revalidating", age)
 
-    # Sort agencies by their short name or name
-    all_fr_agencies.sort(key=lambda x: x['short_name'] if x['short_name'] else x['name'])
+    if all_fr_agencies is None:
+        # Revalidate a stale cached list with its stored ETag / Last-Modified
+        agency_http_cache = {}
+        if cached_agencies is not None:
+            agency_http_cache[AGENCIES_API_URL] = {
+                'etag': cached_agencies.get('etag'),
+                'last_modified': cached_agencies.get('last_modified'),
+                'data': cached_agencies['agencies']
+            }
+
+        # Fetch full list of agencies from Federal Register
+        logger.info("Fetching agency list from Federal Register API")
+        api_start_time = time.time()
+        all_fr_agencies, _ = fetch_json(session, AGENCIES_API_URL, agency_http_cache)
+        if all_fr_agencies is None:
+            logger.error("Unable to retrieve agency list, aborting")
+            return
+        logger.info("Retrieved %s agencies in %.2f seconds", len(all_fr_agencies), time.time() - api_start_time)
+
+        validators = agency_http_cache.get(AGENCIES_API_URL, {})
+        save_cached_agencies(
+            client,
+            bucket_name,
+            agencies_cache_path,
+            all_fr_agencies,
+            etag=validators.get('etag'),
+            last_modified=validators.get('last_modified')
+        )
+
+    # Index agencies by lowercased name for constant-time keyword lookups
+    agency_index = build_agency_index(all_fr_agencies)
+
+    # Caps the PDF transfers queued on the executor at any one time
+    download_slots = threading.BoundedSemaphore(MAX_PENDING_DOWNLOADS)
+
+    # Track unsaved changes to the abstracts index
+    abstracts_dirty = False
+    abstracts_since_flush = 0
 
     # Track overall statistics
     total_documents_processed = 0
@@ -121,157 +386,206 @@ def main():
         agency_start_time = time.time()
         
         # Try to match with the FR agencies list
-        matched_agency = None
-        for a in all_fr_agencies:
-            short_name_or_name = a['short_name'] if a['short_name'] else a['name']
-            if short_name_or_name.lower() == agency_keyword.lower():
-                matched_agency = a
-                break
+        matched_agency = agency_index.get(agency_keyword.lower())
         
         if not matched_agency:
-            log_with_timestamp(f"No agency match found for '{agency_keyword}'. Skipping.", "WARNING")
+            logger.warning("No agency match found for '%s'. Skipping.", agency_keyword)
             continue
         
         short_name = matched_agency['short_name'] if matched_agency['short_name'] else matched_agency['name']
         agency_name = matched_agency['name']
 
-        log_with_timestamp(f"Processing agency: {agency_name}")
+        logger.info("Processing agency: %s", agency_name)
         
+        # Load the names of PDFs already stored for this agency in one listing
+        list_start_time = time.time()
+        existing_keys = {
+            obj.object_name
+            for obj in client.list_objects(bucket_name, prefix=f"{parent_folder}/{short_name}/", recursive=True)
+        }
+        logger.info("Found %s existing documents in %.2f seconds", len(existing_keys), time.time() - list_start_time)
+
         # Track per-agency statistics
         agency_docs_processed = 0
         agency_docs_skipped = 0
         agency_docs_downloaded = 0
+
+        # In-flight PDF transfers for this agency, mapped to their document
+        agency_downloads = {}
         
         # Fetch documents for the chosen agency
         next_page_url = matched_agency['recent_articles_url']
         page_number = 1
         
         # Loop to handle pagination
-        while next_page_url:
-            page_start_time = time.time()
-            log_with_timestamp(f"Fetching page {page_number} from {next_page_url}")
+        # Network failures end this agency's pagination early, but the transfers
+        # already submitted are still collected below so their abstracts are kept
+        try:
+            while next_page_url:
+                page_start_time = time.time()
+                logger.info("Fetching page %s from %s", page_number, next_page_url)
             
-            response = requests.get(next_page_url)
-            if response.status_code != 200:
-                log_with_timestamp(f"Error fetching documents: {response.status_code}", "ERROR")
-                break
-                
-            data = response.json()
-            next_page_url = data.get('next_page_url', None)
+                # Only the first few listing pages are worth revalidating between runs
+                page_cache = http_cache if page_number <= CACHED_LISTING_PAGES else None
+                data, cache_updated = fetch_json(session, next_page_url, page_cache)
+                http_cache_dirty |= cache_updated
+                if data is None:
+                    break
+
+                next_page_url = data.get('next_page_url', None)
             
-            log_with_timestamp(f"Retrieved {len(data['results'])} documents on page {page_number}")
+                logger.info("Retrieved %s documents on page %s", len(data['results']), page_number)
+
+                # Flag to track if we should move to next agency
+                skip_to_next_agency = False
 
-            # Flag to track if we should move to next agency
-            skip_to_next_agency = False
+                # Documents on this page that still need to be downloaded
+                pending_documents = []
 
-            # Loop through the documents and download PDFs if not already uploaded
-            for result in data['results']:
-                doc_start_time = time.time()
+                # Loop through the documents and queue PDFs that are not already uploaded
+                for result in data['results']:
+                    doc_start_time = time.time()
                 
-                pdf_url = result.get('pdf_url')
-                document_number = result['document_number']
-                title = result.get('title', 'Untitled')
-
-                if not pdf_url:
-                    log_with_timestamp(f"No PDF URL for document {document_number}", "WARNING")
-                    continue
-
-                # Build the PDF filename
-                truncated_title = title[:30] + "..." if len(title) > 30 else title
-                pdf_filename = f"{document_number} - {truncated_title}.pdf".replace('/', '_')
-                pdf_object_path = f"{parent_folder}/{short_name}/{pdf_filename}"
-
-                agency_docs_processed += 1
-                total_documents_processed += 1
-
-                # Check if the object already exists on MinIO
-                try:
-                    client.stat_object(bucket_name, pdf_object_path)
-                    doc_time = time.time() - doc_start_time
-                    log_with_timestamp(f"Found existing document: {pdf_filename} (checked in {doc_time:.2f}s)")
-                    agency_docs_skipped += 1
-                    total_documents_skipped += 1
-                    
-                    if not args.all:
-                        log_with_timestamp(f"Stopping pagination for {agency_name} - existing documents found")
-                        skip_to_next_agency = True
-                        break
-                    else:
-                        log_with_timestamp("Continuing due to --all flag")
-                    continue
-                    
-                except Exception:
-                    download_start_time = time.time()
-                    log_with_timestamp(f"Downloading {pdf_filename}")
-                    
-                    pdf_response = requests.get(pdf_url)
-                    if pdf_response.status_code != 200:
-                        log_with_timestamp(f"Error downloading {pdf_url}: {pdf_response.status_code}", "ERROR")
+                    pdf_url = result.get('pdf_url')
+                    document_number = result['document_number']
+                    title = result.get('title', 'Untitled')
+
+                    if not pdf_url:
+                        logger.warning("No PDF URL for document %s", document_number)
                         continue
-                        
-                    upload_start_time = time.time()
-                    log_with_timestamp(f"Uploading {pdf_filename} to MinIO")
+
+                    # Build the PDF filename
+                    truncated_title = title[:30] + "..." if len(title) > 30 else title
+                    pdf_filename = f"{document_number} - {truncated_title}.pdf".translate(SAFE_FILENAME_TABLE)
+                    pdf_object_path = f"{parent_folder}/{short_name}/{pdf_filename}"
+
+                    # Documents uploaded before the wider sanitization only had '/' replaced
+                    legacy_filename = f"{document_number} - {truncated_title}.pdf".replace('/', '_')
+                    legacy_object_path = f"{parent_folder}/{short_name}/{legacy_filename}"
+
+                    agency_docs_processed += 1
+                    total_documents_processed += 1
+
+                    # Check if the object already exists on MinIO
+                    if pdf_object_path in existing_keys or legacy_object_path in existing_keys:
+                        doc_time = time.time() - doc_start_time
+                        logger.info("Found existing document: %s (checked in %.2fs)", pdf_filename, doc_time)
+                        agency_docs_skipped += 1
+                        total_documents_skipped += 1
                     
-                    pdf_data = BytesIO(pdf_response.content)
-                    client.put_object(
+                        if not args.all:
+                            logger.info("Stopping pagination for %s - existing documents found", agency_name)
+                            skip_to_next_agency = True
+                            break
+                        else:
+                            logger.info("Continuing due to --all flag")
+                        continue
+
+                    pending_documents.append((result, pdf_filename, pdf_object_path))
+
+                # Hand the queued PDFs to the transfer pool and move on to the next page
+                for result, pdf_filename, pdf_object_path in pending_documents:
+                    # Block while too many transfers are outstanding
+                    download_slots.acquire()
+                    future = executor.submit(
+                        download_and_upload_pdf,
+                        session,
+                        client,
                         bucket_name,
-                        pdf_object_path,
-                        pdf_data,
-                        length=len(pdf_response.content),
-                        content_type='application/pdf'
-                    )
-                    
-                    agency_docs_downloaded += 1
-                    total_documents_downloaded += 1
-                    
-                    doc_time = time.time() - doc_start_time
-                    download_time = upload_start_time - download_start_time
-                    upload_time = time.time() - upload_start_time
-                    log_with_timestamp(
-                        f"Processed {pdf_filename} in {doc_time:.2f}s "
-                        f"(download: {download_time:.2f}s, upload: {upload_time:.2f}s)"
+                        result['pdf_url'],
+                        pdf_filename,
+                        pdf_object_path
                     )
+                    future.add_done_callback(lambda f: download_slots.release())
+                    agency_downloads[future] = (result, pdf_object_path)
 
-                # Update abstract data
-                abstract = result.get('abstract', 'No abstract available.')
-                publication_date = result.get('publication_date', 'Unknown')
-                existing_abstract_entry = existing_abstracts.get(document_number, {})
-                existing_abstract_entry.update({
-                    'abstract': abstract,
-                    'title': title,
-                    'publication_date': publication_date,
-                    'agency_name': agency_name,
-                    'pdf_path': pdf_object_path
-                })
-                existing_abstracts[document_number] = existing_abstract_entry
-
-            page_time = time.time() - page_start_time
-            log_with_timestamp(f"Completed page {page_number} in {page_time:.2f} seconds")
+                page_time = time.time() - page_start_time
+                logger.info("Completed page %s in %.2f seconds", page_number, page_time)
             
-            if skip_to_next_agency:
-                break
+                if skip_to_next_agency:
+                    break
                 
-            page_number += 1
+                page_number += 1
+        except requests.RequestException as e:
+            logger.error("Error fetching documents for %s: %s", agency_name, e)
+
+        # Wait for this agency's transfers and record the ones that succeeded,
+        # in listing order so abstracts.json keys stay stable between runs
+        for future, (result, pdf_object_path) in agency_downloads.items():
+            try:
+                uploaded = future.result()
+            except Exception as e:
+                logger.error("Error processing %s: %s", pdf_object_path, e)
+                continue
+            if not uploaded:
+                continue
+
+            existing_keys.add(pdf_object_path)
+            agency_docs_downloaded += 1
+            total_documents_downloaded += 1
+
+            # Update abstract data, skipping entries that already match
+            document_number = result['document_number']
+            new_abstract_entry = {
+                'abstract': result.get('abstract', 'No abstract available.'),
+                'title': result.get('title', 'Untitled'),
+                'publication_date': result.get('publication_date', 'Unknown'),
+                'agency_name': agency_name,
+                'pdf_path': pdf_object_path
+            }
+            existing_abstract_entry = existing_abstracts.get(document_number, {})
+            if new_abstract_entry.items() <= existing_abstract_entry.items():
+                continue
+            existing_abstract_entry.update(new_abstract_entry)
+            existing_abstracts[document_number] = existing_abstract_entry
+            abstracts_dirty = True
+            abstracts_since_flush += 1
 
         agency_time = time.time() - agency_start_time
-        log_with_timestamp(
-            f"Completed {agency_name} in {agency_time:.2f} seconds:\n"
-            f"  - Documents processed: {agency_docs_processed}\n"
-            f"  - Documents skipped: {agency_docs_skipped}\n"
-            f"  - Documents downloaded: {agency_docs_downloaded}"
+        logger.info(
+            "Completed %s in %.2f seconds:\n"
+            "  - Documents processed: %s\n"
+            "  - Documents skipped: %s\n"
+            "  - Documents downloaded: %s",
+            agency_name, agency_time, agency_docs_processed, agency_docs_skipped, agency_docs_downloaded
         )
 
-    # Save final abstracts to MinIO
-    save_abstracts_to_minio(client, bucket_name, abstracts_path, existing_abstracts)
+        # Periodically flush abstracts so a crash doesn't lose all progress
+        if abstracts_since_flush >= ABSTRACTS_FLUSH_INTERVAL:
+            save_abstracts_to_minio(client, bucket_name, abstracts_path, existing_abstracts)
+            abstracts_dirty = False
+            abstracts_since_flush = 0
+
+    # Save final abstracts to MinIO if anything changed since the last save
+    if abstracts_dirty:
+        save_abstracts_to_minio(client, bucket_name, abstracts_path, existing_abstracts)
+    else:
+        logger.info("No abstract changes to save")
+    # Only upload the HTTP cache when a fresh response was stored in it
+    if http_cache_dirty:
+        save_http_cache(client, bucket_name, http_cache_path, http_cache)
     
     script_time = time.time() - script_start_time
-    log_with_timestamp(
-        f"Script completed in {script_time:.2f} seconds\n"
-        f"Total statistics:\n"
-        f"  - Documents processed: {total_documents_processed}\n"
-        f"  - Documents skipped: {total_documents_skipped}\n"
-        f"  - Documents downloaded: {total_documents_downloaded}"
+    logger.info(
+        "Script completed in %.2f seconds\n"
+        "Total statistics:\n"
+        "  - Documents processed: %s\n"
+        "  - Documents skipped: %s\n"
+        "  - Documents downloaded: %s",
+        script_time, total_documents_processed, total_documents_skipped, total_documents_downloaded
     )
 
+def main():
+    configure_logging()
+
+    # Share one pooled HTTP session across every request in the run
+    session = create_session()
+    try:
+        # Listing pages are fetched while earlier PDFs are still transferring
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+            scrape(session, executor)
+    finally:
+        session.close()
+
 if __name__ == "__main__":
     main()